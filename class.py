@@ -5,29 +5,37 @@
 
 # Parent class (Base Client)
 class Client:
+    # __slots__ = fixed attribute layout instead of a per-instance __dict__
+    # (smaller objects, faster attribute access)
+    __slots__ = ('name', 'credits')
+
     # __init__ runs when you create a new client
     # name: client's name, credits: starting credits
     def __init__(self, name, credits):
         self.name = name
-        self.__credits = credits  # private variable (hidden / protected)
-
-    # Property = acts like a variable, but actually calls a function
-    @property
-    def credits(self):
-        return self.__credits  # safe read-only access
+        self.set_credits(credits)  # validated once, then read directly
 
-    # Setter = safe way to modify private data
-    @credits.setter
-    def credits(self, value):
+    # credits is a plain attribute so reads are a direct lookup (no property call)
+    # Setter = safe way to modify it with validation
+    def set_credits(self, value):
         if value < 0:
             raise ValueError("Credits cannot be negative")
-        self.__credits = value
+        self.credits = value
 
     # Method to deduct credits if enough exist
     # Returns True/False to indicate success/failure
     def use_credit(self, cost=1):
-        if self.__credits >= cost:
-            self.__credits -= cost
+        if self.credits >= cost:
+            self.credits -= cost
+            return True
+        return False
+
+    # Fast path for the common single-credit charge
+    # Same result as use_credit() with cost=1, without the general cost check
+    def spend_one(self):
+        c = self.credits
+        if c > 0:
+            self.credits = c - 1
             return True
         return False
 
@@ -38,6 +46,8 @@ class Client:
 
 # Free users - lowest limits
 class FreeClient(Client):
+    __slots__ = ('rate_limit', 'support')
+
     def __init__(self, name):
         super().__init__(name, credits=1000)  # call parent class
         self.rate_limit = 60  # requests per minute
@@ -46,6 +56,8 @@ class FreeClient(Client):
 
 # Pro users - higher limits
 class ProClient(Client):
+    __slots__ = ('rate_limit', 'support')
+
     def __init__(self, name):
         super().__init__(name, credits=100000)
         self.rate_limit = 600
@@ -54,6 +66,8 @@ class ProClient(Client):
 
 # Enterprise users - biggest limits & perk
 class EnterpriseClient(Client):
+    __slots__ = ('rate_limit', 'support')
+
     def __init__(self, name):
         super().__init__(name, credits=10000000)
         self.rate_limit = 5000
@@ -77,11 +91,11 @@ if __name__ == "__main__":
 
     # Spend credits
     print("\n=== Spending Credits ===")
-    free.use_credit()  # spend 1
+    free.spend_one()  # spend 1
     print(f"After spending, {free.name}: {free.credits} credits")
 
     # Testing validation: uncomment to see failure
-    # free.credits = -50  # This would raise an exception
+    # free.set_credits(-50)  # This would raise an exception
 
     # Subscription benefits
     print("\n=== Subscription Perks ===")
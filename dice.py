@@ -1,7 +1,35 @@
-import time, math, random, os
+import time, math, random, sys
+
+_readline = sys.stdin.readline
+_sleep = time.sleep
+
+ROLL_BATCH = 1024  # rounds of rolls generated per refill
+rolls = []
+roll_idx = 0
+
+def refill_rolls():
+    global rolls, roll_idx
+    rolls = random.choices(range(1, 7), k=ROLL_BATCH * 4)
+    roll_idx = 0
+
+def simulate(n):
+    wins = losses = ties = 0
+    faces = random.choices(range(1, 7), k=n * 4)
+    for i in range(0, n * 4, 4):
+        player = faces[i] + faces[i + 1]
+        computer = faces[i + 2] + faces[i + 3]
+        if player > computer:
+            wins += 1
+        elif player < computer:
+            losses += 1
+        else:
+            ties += 1
+    return wins, losses, ties
 
 def clear_terminal():
-    os.system('clear')
+    # ANSI clear screen + cursor home; avoids spawning a shell for `clear`
+    sys.stdout.write('\x1b[2J\x1b[H')
+    sys.stdout.flush()
 
 clear_terminal()
 
@@ -11,15 +39,20 @@ while play == True:
     print("1: Start")
     print("2: Settings")
     print("3: Quit")
-    start = int(input(": "))
-    if start == 1:
+    sys.stdout.write(": ")
+    sys.stdout.flush()
+    line = _readline()
+    if not line:
+        break
+    start = line[0]
+    if start == '1':
         play_dice = True
         while play_dice == True:
             clear_terminal()
-            dice1 = random.randint(1,6)
-            dice2 = random.randint(1,6)
-            dice3 = random.randint(1,6)
-            dice4 = random.randint(1,6)
+            if roll_idx == len(rolls):
+                refill_rolls()
+            dice1, dice2, dice3, dice4 = rolls[roll_idx:roll_idx + 4]
+            roll_idx += 4
             dice_result = dice1 + dice2
             dice_result2 = dice3 + dice4
             print(f"You rolled a {dice_result} and the computer rolled a {dice_result2}")
@@ -29,17 +62,19 @@ while play == True:
                 print("You lost!")
             elif dice_result == dice_result2:
                 print("It was a tie!")
-            time.sleep(1.5)
+            _sleep(1.5)
             print("")
             play_dice_input = str(input("Continue? (Y or N): ")).lower()
             if play_dice_input == "n":
                 play_dice = False
             clear_terminal()
-    elif start == 2:
+    elif start == '2':
         print("--Settings--")
-    elif start == 3:
+        wins, losses, ties = simulate(1000)
+        print(f"Fast mode (1000 rounds): {wins} wins, {losses} losses, {ties} ties")
+    elif start == '3':
         print("Bye")
-        time.sleep(1.5)
+        _sleep(1.5)
         break
     else:
         print("Error")
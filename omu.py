@@ -1,172 +1,249 @@
 import curses
 
+DIRS = ((-1,0),(1,0),(0,-1),(0,1))  # up, down, left, right
+
 main_map = [
-    list("|=================================================================================================================================|"),
-    list("|            |              |              |                                  |                                                   |"),
-    list("|            |              |              |                                  |                                                   |"),
-    list("|            |              #              #                                  |                                                   |"),
-    list("|            |              #              #                                  |                                                   |"),
-    list("|            |              |              |                                  |                                                   |"),
-    list("|            {==============}              {==================================|====================##=============================|"),
-    list("|                                                                                                               |"),
-    list("|                                                                                                               |"),
-    list("|                                                                                                               |"),
-    list("|                                                                                                               |"),
-    list("|                                                                                                               |"),
-    list("|                                           {=========##======================|===============##================|"),
-    list("|------------------------                   |                                 |                                 |"),
-    list("|                                           |                                 |                                 |"),
-    list("|                                           |                                 |                                 |"),
-    list("|===============}                           |                                 |                                 |"),
-    list("|               |                           |                                 |                                 |"),
-    list("|               #                           |                                 |                                 |"),
-    list("|               #                           |                                 |                                 |"),
-    list("|===============|===========================|=================================|=================================|"),
+    "|=================================================================================================================================|",
+    "|            |              |              |                                  |                                                   |",
+    "|            |              |              |                                  |                                                   |",
+    "|            |              #              #                                  |                                                   |",
+    "|            |              #              #                                  |                                                   |",
+    "|            |              |              |                                  |                                                   |",
+    "|            {==============}              {==================================|====================##=============================|",
+    "|                                                                                                               |",
+    "|                                                                                                               |",
+    "|                                                                                                               |",
+    "|                                                                                                               |",
+    "|                                                                                                               |",
+    "|                                           {=========##======================|===============##================|",
+    "|------------------------                   |                                 |                                 |",
+    "|                                           |                                 |                                 |",
+    "|                                           |                                 |                                 |",
+    "|===============}                           |                                 |                                 |",
+    "|               |                           |                                 |                                 |",
+    "|               #                           |                                 |                                 |",
+    "|               #                           |                                 |                                 |",
+    "|===============|===========================|=================================|=================================|",
 ]
 
-max_main_map_len = max(len(row) for row in main_map)
-for i, row in enumerate(main_map):
-    if len(row) < max_main_map_len:
-        main_map[i] += [' '] * (max_main_map_len - len(row))
+# Rows are padded to the widest one so the map is a rectangle
+max_main_map_len = max(map(len, main_map))
+main_map = [row.ljust(max_main_map_len) for row in main_map]
 
 def make_room_map(room_num):
-    return [
-        list("|_____________|"),
-        list("|             |"),
-        list(f"|   ROOM {room_num}    |"),
-        list("|             |"),
-        list("|             |"),
-        list("|      <      |"),
-        list("|_____________|"),
-    ]
-
-maps = {'main': main_map}
+    return (
+        "|_____________|",
+        "|             |",
+        f"|   ROOM {room_num}    |",
+        "|             |",
+        "|             |",
+        "|      <      |",
+        "|_____________|",
+    )
+
+# Static row strings per map; draw_map and the flat buffers are built from these
+map_strs = {'main': tuple(main_map)}
 for i in range(1, 9):
-    maps[f'room{i}'] = make_room_map(i)
+    map_strs[f'room{i}'] = make_room_map(i)
+
+def flatten_map(rows):
+    # Store a map as one flat bytearray plus its width; cell (r, c) is buf[r * width + c]
+    return bytearray(''.join(rows), 'ascii'), len(rows[0])
+
+maps = {key: flatten_map(rows) for key, rows in map_strs.items()}
+
+WALL_SET = frozenset(b'|=-_#')
+START_BLOCKED = frozenset(b'#|=-_<')
+
+# Byte -> 1 if walkable else 0; translate() turns a map buffer into its passable bitmap
+PASSABLE_TABLE = bytes(0 if b in WALL_SET else 1 for b in range(256))
+passable = {key: buf.translate(PASSABLE_TABLE) for key, (buf, width) in maps.items()}
+
+def cell_color(ch):
+    if ch in ('#', '|', '_'):
+        return 1
+    if ch == '<':
+        return 3
+    return 0
+
+def make_row_runs(rows):
+    # Pair each row string with its (start, end, color_pair) runs,
+    # so draw_map can emit one addstr per run instead of one addch per cell.
+    row_runs = []
+    for line in rows:
+        runs = []
+        start = 0
+        for c in range(1, len(line) + 1):
+            if c == len(line) or cell_color(line[c]) != cell_color(line[start]):
+                runs.append((start, c, cell_color(line[start])))
+                start = c
+        row_runs.append((line, tuple(runs)))
+    return tuple(row_runs)
+
+map_rows = {key: make_row_runs(rows) for key, rows in map_strs.items()}
 
 current_map_key = 'main'
-dungeon_map = maps[current_map_key]
+dungeon_buf, dungeon_width = maps[current_map_key]
+dungeon_passable = passable[current_map_key]
+dungeon_height = len(dungeon_buf) // dungeon_width
 
-def find_room_exit(room_map):
-    for r, row in enumerate(room_map):
-        for c, ch in enumerate(row):
-            if ch == '<':
-                return (r, c)
-    return None
+def find_room_exit(buf, width):
+    i = buf.find(b'<')
+    if i == -1:
+        return None
+    return divmod(i, width)
 
 def find_entrances():
+    buf, width = maps['main']
     entrances = {}
-    room_idx = 1
-    for r, row in enumerate(main_map):
-        for c, ch in enumerate(row):
-            if ch == '#':
-                entrances[(r, c)] = f'room{room_idx}'
-                room_idx += 1
-                if room_idx > 8:
-                    break
-        if room_idx > 8:
-            break
+    i = buf.find(b'#')
+    while i != -1 and len(entrances) < 8:
+        entrances[divmod(i, width)] = f'room{len(entrances) + 1}'
+        i = buf.find(b'#', i + 1)
     return entrances
 
+def neighbor_cells(r, c, buf, width):
+    # Yields in-bounds cells whose up/down/left/right neighbour is (r, c), in that order
+    height = len(buf) // width
+    for dr, dc in DIRS:
+        nr, nc = r - dr, c - dc
+        if 0 <= nr < height and 0 <= nc < width:
+            yield nr, nc
+
 entrances = find_entrances()
 room_exits = {}
 for key in maps:
     if key != 'main':
-        room_exits[key] = find_room_exit(maps[key])
+        room_exits[key] = find_room_exit(*maps[key])
+
+# Cell -> room for every cell next to an entrance; setdefault keeps the
+# first direction in scan order, matching the old per-keypress search
+entrance_neighbors = {}
+for (er, ec), room in entrances.items():
+    for cell in neighbor_cells(er, ec, *maps['main']):
+        entrance_neighbors.setdefault(cell, room)
+
+exit_neighbors = {}
+for key, exit_pos in room_exits.items():
+    if exit_pos:
+        exit_neighbors[key] = frozenset(neighbor_cells(*exit_pos, *maps[key]))
+
+class Pos:
+    # Saved player position for a map; updated in place when leaving it
+    __slots__ = ('r', 'c')
+
+    def __init__(self, r, c):
+        self.r = r
+        self.c = c
+
+# Byte -> 1 if the player may start there; the first 1 found is the start cell
+START_TABLE = bytes(0 if b in START_BLOCKED else 1 for b in range(256))
 
 player_positions = {}
-for key, m in maps.items():
-    found = False
-    for r, row in enumerate(m):
-        for c, ch in enumerate(row):
-            if ch not in ('#', '|', '=', '-', '_', '<'):
-                player_positions[key] = [r, c]
-                found = True
-                break
-        if found:
-            break
-    if not found:
-        player_positions[key] = [1, 1]
-player_pos = player_positions['main'][:]
+for key, (buf, width) in maps.items():
+    i = buf.translate(START_TABLE).find(1)
+    if i == -1:
+        player_positions[key] = Pos(1, 1)
+    else:
+        player_positions[key] = Pos(i // width, i % width)
+player_pos = [player_positions['main'].r, player_positions['main'].c]
+
+def draw_cell(stdscr, r, c):
+    max_y, max_x = stdscr.getmaxyx()
+    if not (0 <= r < max_y - 1 and 0 <= c < max_x):
+        return
+    ch = map_rows[current_map_key][r][0][c]
+    try:
+        stdscr.addch(r, c, ord(ch), curses.color_pair(cell_color(ch)))
+    except curses.error:
+        pass
+
+def draw_player(stdscr):
+    max_y, max_x = stdscr.getmaxyx()
+    r, c = player_pos
+    if 0 <= r < max_y - 1 and 0 <= c < max_x:
+        try:
+            stdscr.addch(r, c, ord('@'), curses.color_pair(2))
+        except curses.error:
+            pass
 
 def draw_map(stdscr):
     stdscr.clear()
     max_y, max_x = stdscr.getmaxyx()
-    for r, row in enumerate(dungeon_map):
+    for r, (line, runs) in enumerate(map_rows[current_map_key]):
         if r >= max_y - 1:
             break
-        for c, ch in enumerate(row):
-            if c >= max_x:
+        for start, end, pair in runs:
+            if start >= max_x:
                 break
             try:
-                if [r, c] == player_pos and 0 <= r < max_y and 0 <= c < max_x:
-                    stdscr.addch(r, c, ord('@'), curses.color_pair(2))
-                else:
-                    if ch in ('#', '|', '_'):
-                        stdscr.addch(r, c, ord(ch), curses.color_pair(1))
-                    elif ch == '<':
-                        stdscr.addch(r, c, ord(ch), curses.color_pair(3))
-                    else:
-                        stdscr.addch(r, c, ord(ch), curses.color_pair(0))
+                stdscr.addstr(r, start, line[start:min(end, max_x)], curses.color_pair(pair))
             except curses.error:
                 pass
+    draw_player(stdscr)
+    status = "Move: w/a/s/d, interact: e, quit: q"
+    try:
+        stdscr.addstr(max_y - 1, 0, status[:max_x-1])
+    except curses.error:
+        pass
 
 def is_adjacent_to_entrance(r, c):
-    for dr, dc in [(-1,0),(1,0),(0,-1),(0,1)]:
-        nr, nc = r + dr, c + dc
-        if (nr, nc) in entrances and dungeon_map[nr][nc] == '#':
-            return entrances[(nr, nc)]
-    return None
+    return entrance_neighbors.get((r, c))
 
 def is_adjacent_to_exit(r, c, room_key):
-    exit_pos = room_exits.get(room_key)
-    if not exit_pos:
-        return False
-    er, ec = exit_pos
-    for dr, dc in [(-1,0),(1,0),(0,-1),(0,1)]:
-        if [r + dr, c + dc] == [er, ec]:
-            return True
-    return False
+    return (r, c) in exit_neighbors.get(room_key, ())
 
 def enter_room(room_name):
-    global dungeon_map, current_map_key, player_pos
-    player_positions[current_map_key] = player_pos[:]
+    global dungeon_buf, dungeon_width, dungeon_passable, dungeon_height, current_map_key, player_pos
+    saved = player_positions[current_map_key]
+    saved.r, saved.c = player_pos
     current_map_key = room_name
-    dungeon_map = maps[room_name]
-    player_pos[:] = player_positions[room_name][:]
+    dungeon_buf, dungeon_width = maps[room_name]
+    dungeon_passable = passable[room_name]
+    dungeon_height = len(dungeon_buf) // dungeon_width
+    p = player_positions[room_name]
+    player_pos[0] = p.r
+    player_pos[1] = p.c
 
 def return_to_main():
-    global dungeon_map, current_map_key, player_pos
-    player_positions[current_map_key] = player_pos[:]
+    global dungeon_buf, dungeon_width, dungeon_passable, dungeon_height, current_map_key, player_pos
+    saved = player_positions[current_map_key]
+    saved.r, saved.c = player_pos
     current_map_key = 'main'
-    dungeon_map = maps['main']
-    player_pos[:] = player_positions['main'][:]
+    dungeon_buf, dungeon_width = maps['main']
+    dungeon_passable = passable['main']
+    dungeon_height = len(dungeon_buf) // dungeon_width
+    p = player_positions['main']
+    player_pos[0] = p.r
+    player_pos[1] = p.c
 
 def can_move_to(r, c):
-    if r < 0 or r >= len(dungeon_map) or c < 0 or c >= len(dungeon_map[0]):
-        return False
-    ch = dungeon_map[r][c]
-    if ch in ('|', '=', '-', '_', '#'):
-        return False
-    return True
+    return 0 <= r < dungeon_height and 0 <= c < dungeon_width and dungeon_passable[r * dungeon_width + c]
 
-def main(stdscr):
-    global player_pos
-    curses.curs_set(0)
-    stdscr.nodelay(True)
-    stdscr.timeout(100)
+colors_ready = False
+
+def setup_colors():
+    # Color pairs only need registering once per process
+    global colors_ready
+    if colors_ready:
+        return
     curses.start_color()
     curses.use_default_colors()
     curses.init_pair(1, curses.COLOR_WHITE, -1)
     curses.init_pair(2, curses.COLOR_YELLOW, -1)
     curses.init_pair(3, curses.COLOR_CYAN, -1)
+    colors_ready = True
+
+def main(stdscr):
+    global player_pos
+    curses.curs_set(0)
+    setup_colors()
+    # Nothing animates, so block on getch and only redraw after a key
+    draw_map(stdscr)
     while True:
-        draw_map(stdscr)
-        max_y, max_x = stdscr.getmaxyx()
-        status = "Move: w/a/s/d, interact: e, quit: q"
-        r, c = player_pos
-        stdscr.addstr(max_y - 1, 0, status[:max_x-1])
         key = stdscr.getch()
+        r, c = player_pos
+        map_key = current_map_key
         if key == ord('q'):
             break
         elif key == ord('w') and can_move_to(r - 1, c):
@@ -185,5 +262,11 @@ def main(stdscr):
             else:
                 if is_adjacent_to_exit(r, c, current_map_key):
                     return_to_main()
+        if current_map_key != map_key or key == curses.KEY_RESIZE:
+            draw_map(stdscr)
+        elif player_pos[0] != r or player_pos[1] != c:
+            # Plain step: restore the old cell and draw '@' at the new one
+            draw_cell(stdscr, r, c)
+            draw_player(stdscr)
 
 curses.wrapper(main)
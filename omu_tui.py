@@ -3,14 +3,27 @@ import curses
 import random
 import time
 import heapq
+from array import array
 from collections import deque, defaultdict
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import List, Tuple, Optional, Dict, Set
 
 # Among-Us-like single-player terminal game using curses with improved bot pathfinding (A*)
 # Two-phase bot movement prevents overlap/swap; meeting/report prompt is clearer.
 
 Point = Tuple[int, int]  # (y, x)
+Cell = Tuple[int, int]  # (ch, attr) as drawn on screen
+
+INF = 1_000_000_000  # "unreached" g-score in the flat A* buffers
+
+# Map cell bytes
+WALL = ord('#')
+FLOOR = ord('.')
+TASK = ord('T')
+WALKABLE_TABLE = bytes(0 if b == WALL else 1 for b in range(256))  # map byte -> walkable 0/1
+
+BLANK: Cell = (ord(' '), 0)
 
 HELP_TEXT = [
     "Controls: Arrow Keys / WASD to move, E to start/stop task, R to report, H to toggle help, Q to quit",
@@ -39,6 +52,8 @@ class NPC(Entity):
     current_path: List[Point] = field(default_factory=list)  # list of steps to goal (excluding current pos)
     last_pos: Optional[Point] = None
     repath_after: float = 0.0  # time after which we allow re-path even if target unchanged
+    # Entity(eq=True) sets __hash__ = None and eq=False here doesn't restore it; use identity hashing
+    __hash__ = object.__hash__
 
 @dataclass
 class Corpse:
@@ -47,6 +62,88 @@ class Corpse:
     x: int
     discovered: bool = False
 
+def astar_flat(walkable: bytes, blocked: bytearray, sid: int, gid: int, w: int, h_cache: Dict[int, int],
+               g_score: array, came_from: array, closed: bytearray,
+               open_heap: List[Tuple[int, int, int]], touched: List[int]) -> List[Point]:
+    # A* over flat cell ids; kept free of self/attribute lookups so the hot loop only touches locals.
+    # The scratch buffers must arrive reset (g=INF, came=-1, closed=0) and are reset again on exit.
+    gy, gx = divmod(gid, w)
+    heappush, heappop = heapq.heappush, heapq.heappop
+    g_score[sid] = 0
+    touched.append(sid)
+    sy, sx = divmod(sid, w)
+    open_heap.append((abs(sy - gy) + abs(sx - gx), 0, sid))
+
+    try:
+        while open_heap:
+            _, g, cid = heappop(open_heap)
+            if closed[cid]:
+                continue
+            closed[cid] = 1
+            if cid == gid:
+                break
+            # Four straight-line probes (up, down, left, right) instead of a loop over offsets
+            ng = g + 1
+            nid = cid - w
+            if walkable[nid] and (not blocked[nid] or nid == gid) and ng < g_score[nid]:
+                g_score[nid] = ng
+                came_from[nid] = cid
+                touched.append(nid)
+                hv = h_cache.get(nid)
+                if hv is None:
+                    y, x = divmod(nid, w)
+                    hv = h_cache[nid] = abs(y - gy) + abs(x - gx)
+                heappush(open_heap, (ng + hv, ng, nid))
+            nid = cid + w
+            if walkable[nid] and (not blocked[nid] or nid == gid) and ng < g_score[nid]:
+                g_score[nid] = ng
+                came_from[nid] = cid
+                touched.append(nid)
+                hv = h_cache.get(nid)
+                if hv is None:
+                    y, x = divmod(nid, w)
+                    hv = h_cache[nid] = abs(y - gy) + abs(x - gx)
+                heappush(open_heap, (ng + hv, ng, nid))
+            nid = cid - 1
+            if walkable[nid] and (not blocked[nid] or nid == gid) and ng < g_score[nid]:
+                g_score[nid] = ng
+                came_from[nid] = cid
+                touched.append(nid)
+                hv = h_cache.get(nid)
+                if hv is None:
+                    y, x = divmod(nid, w)
+                    hv = h_cache[nid] = abs(y - gy) + abs(x - gx)
+                heappush(open_heap, (ng + hv, ng, nid))
+            nid = cid + 1
+            if walkable[nid] and (not blocked[nid] or nid == gid) and ng < g_score[nid]:
+                g_score[nid] = ng
+                came_from[nid] = cid
+                touched.append(nid)
+                hv = h_cache.get(nid)
+                if hv is None:
+                    y, x = divmod(nid, w)
+                    hv = h_cache[nid] = abs(y - gy) + abs(x - gx)
+                heappush(open_heap, (ng + hv, ng, nid))
+
+        if came_from[gid] == -1:
+            return []
+
+        # Reconstruct path (excluding start), result is [step1, step2, ..., goal]
+        cur = gid
+        rev: List[Point] = []
+        while cur != sid:
+            rev.append(divmod(cur, w))
+            cur = came_from[cur]
+        rev.reverse()
+        return rev
+    finally:
+        for i in touched:
+            g_score[i] = INF
+            came_from[i] = -1
+            closed[i] = 0
+        touched.clear()
+        open_heap.clear()
+
 class Game:
     def __init__(self, stdscr):
         self.stdscr = stdscr
@@ -54,19 +151,40 @@ class Game:
         # Generate a spacious map with wide corridors and rooms
         self.height = 24
         self.width = 64
-        self.map = self.generate_map(self.width, self.height, corridor_w=3, room_count=(5, 7))
+        # The map and other per-cell buffers are flat, indexed by y*width + x. Map edges are
+        # always walls, so the +-1 / +-width neighbour offsets of a walkable cell never leave the grid.
+        self._N = self.width * self.height
+        self.map_flat = self.generate_map(self.width, self.height, corridor_w=3, room_count=(5, 7))
 
         # Walkable tiles are anything not a wall '#'
+        self.walkable_mask = self.map_flat.translate(WALKABLE_TABLE)
         self.walkable: Set[Point] = set(
-            (y, x) for y in range(self.height) for x in range(self.width) if self.map[y][x] != '#'
+            divmod(i, self.width) for i in range(self._N) if self.walkable_mask[i]
         )
 
+        # A* scratch buffers shared by every astar_path call; only touched cells are reset afterwards
+        self._g_score = array('i', [INF]) * self._N
+        self._came_from = array('i', [-1]) * self._N
+        self._closed = bytearray(self._N)
+        self._open_heap: List[Tuple[int, int, int]] = []
+        self._touched: List[int] = []
+
+        # Entity occupancy bitmap rebuilt each AI pass (only previously marked cells are cleared)
+        self._occupancy = bytearray(self._N)
+        self._occupied_ids: List[int] = []
+        # Per-tick conflict-resolution scratch, cleared and reused by update()
+        self._dest_map: Dict[Point, List[NPC]] = {}
+        self._dest_lists_pool: List[List[NPC]] = []
+        self._approved: Set[NPC] = set()
+        # 1 on every cell on or next to a corpse; near_corpse is a single lookup
+        self._corpse_zone = bytearray(self._N)
+
         # Extract tasks from map ('T')
         self.tasks: Dict[Point, float] = {}  # progress 0..1
-        for y in range(self.height):
-            for x in range(self.width):
-                if self.map[y][x] == 'T':
-                    self.tasks[(y, x)] = 0.0
+        i = self.map_flat.find(TASK)
+        while i != -1:
+            self.tasks[divmod(i, self.width)] = 0.0
+            i = self.map_flat.find(TASK, i + 1)
 
         # Player start: free tile near center
         py, px = self.find_free_tile_near_center()
@@ -93,6 +211,24 @@ class Game:
         if self.npcs:
             random.choice(self.npcs).role = "impostor"
 
+        # Live position index: cell -> living entities on it. Bots can end up stacked on a
+        # cell (e.g. a shared task tile), so each cell holds a list; _rank keeps entity_at's
+        # old answer for stacks (player first, then self.npcs order).
+        self._rank: Dict[int, int] = {id(e): i for i, e in enumerate([self.player] + self.npcs)}
+        self._pos_index: Dict[Point, List[Entity]] = {}
+        for e in [self.player] + self.npcs:
+            self._index_add(e)
+
+        # Living crew (player included) and impostors; adjusted in mark_dead() so the
+        # win check and HUD don't rescan self.npcs
+        self._crew_alive_count = 1
+        self._impostor_alive_count = 0
+        for n in self.npcs:
+            if n.role == "impostor":
+                self._impostor_alive_count += 1
+            else:
+                self._crew_alive_count += 1
+
         self.corpses: List[Corpse] = []
 
         # Time control
@@ -105,6 +241,11 @@ class Game:
         self.running = True
         self.show_help = True
 
+        # Bot scheduling: oldest last_move_time among living bots, and whether the player
+        # moved since the last AI pass (update() skips the AI while neither can change anything)
+        self._earliest_bot_move = 0.0
+        self._player_moved = False
+
         # Meetings
         self.meeting_mode = False
         self.meeting_message = ""
@@ -123,6 +264,24 @@ class Game:
         # Intersections for patrols
         self.intersections: List[Point] = self.compute_intersections()
 
+        # Pre-rendered map rows (wall glyphs baked in) and the bordered (ch, attr) frame built from them
+        self.static_rows: List[str] = []
+        self.static_frame: List[List[Cell]] = []
+        self.build_static_rows()
+
+        # A* heuristic memo: goal -> {cell id: manhattan distance}; the map is static so entries stay valid
+        self._h_cache: Dict[Point, Dict[Point, int]] = {}
+        self._h_cache_goals = 64  # cap on cached goals (impostor goals follow moving targets)
+
+        # Last frame pushed to curses; render() only re-emits cells that differ from it
+        self.prev_frame: Optional[List[List[Cell]]] = None
+        self._draw_ops: List[Tuple[int, int, str, int]] = []  # (y, x, text, attrs), rebuilt each frame
+        self._meeting_drawn = False
+        # Set whenever something visible changes; loop() skips render() while it is clear
+        self._dirty = True
+        self._render_ema_ns = 0  # moving average of render() time, used by loop() to drop frames
+        self._task_bar_w = min(30, self.width - 2)
+
     # ---------------- Colors ----------------
     def setup_colors(self):
         try:
@@ -141,15 +300,19 @@ class Game:
 
     # ---------------- Map generation and utilities ----------------
 
-    def generate_map(self, width: int, height: int, corridor_w: int = 3, room_count: Tuple[int, int] = (5, 7)) -> List[List[str]]:
+    def generate_map(self, width: int, height: int, corridor_w: int = 3, room_count: Tuple[int, int] = (5, 7)) -> bytearray:
         rnd = random.Random()
         rnd.seed()
-        grid = [['#' for _ in range(width)] for _ in range(height)]
+        grid = bytearray([WALL]) * (width * height)
 
-        def carve_rect(y1, x1, y2, x2, ch='.'):
+        def carve_rect(y1, x1, y2, x2, ch=FLOOR):
+            # Clip to the interior, then fill one slice per row instead of one write per cell
+            x1, x2 = max(1, x1), min(width-1, x2+1)
+            if x1 >= x2:
+                return
+            run = bytes([ch]) * (x2 - x1)
             for y in range(max(1, y1), min(height-1, y2+1)):
-                for x in range(max(1, x1), min(width-1, x2+1)):
-                    grid[y][x] = ch
+                grid[y*width + x1:y*width + x2] = run
 
         rooms: List[Tuple[int, int, int, int]] = []
         target_rooms = rnd.randint(room_count[0], room_count[1])
@@ -168,26 +331,19 @@ class Game:
             if any(overlaps(new_room, r) for r in rooms):
                 continue
             rooms.append(new_room)
-            carve_rect(*new_room, ch='.')
+            carve_rect(*new_room, ch=FLOOR)
 
         if rooms:
             centers = [((r[0]+r[2])//2, (r[1]+r[3])//2) for r in rooms]
             remaining = set(range(1, len(centers)))
             connected = {0}
+            half = corridor_w // 2
             def carve_horiz(y, x1, x2):
                 if x1 > x2: x1, x2 = x2, x1
-                for x in range(x1, x2+1):
-                    for dy in range(-(corridor_w//2), (corridor_w//2)+1):
-                        yy = y + dy
-                        if 1 <= yy < height-1 and 1 <= x < width-1:
-                            grid[yy][x] = '.'
+                carve_rect(y - half, x1, y + half, x2)
             def carve_vert(x, y1, y2):
                 if y1 > y2: y1, y2 = y2, y1
-                for y in range(y1, y2+1):
-                    for dx in range(-(corridor_w//2), (corridor_w//2)+1):
-                        xx = x + dx
-                        if 1 <= y < height-1 and 1 <= xx < width-1:
-                            grid[y][xx] = '.'
+                carve_rect(y1, x - half, y2, x + half)
             while remaining:
                 best = None
                 for j in remaining:
@@ -208,30 +364,83 @@ class Game:
                 connected.add(j)
                 remaining.remove(j)
 
-        floor = [(y, x) for y in range(2, height-2) for x in range(2, width-2) if grid[y][x] == '.']
+        floor: List[Point] = []
+        for y in range(2, height-2):
+            row = y*width
+            i = grid.find(FLOOR, row + 2, row + width - 2)
+            while i != -1:
+                floor.append((y, i - row))
+                i = grid.find(FLOOR, i + 1, row + width - 2)
         random.shuffle(floor)
         for (ty, tx) in floor[:8]:
-            grid[ty][tx] = 'T'
+            grid[ty*width + tx] = TASK
         return grid
 
+    def build_static_rows(self):
+        # One pass over the map: orient wall glyphs from their wall neighbours and bake them
+        # into static_rows / static_frame, so render never looks at wall geometry again.
+        w, h = self.width, self.height
+        grid = self.map_flat
+        wall_attr = curses.color_pair(1)
+        task_attr = curses.color_pair(4) | curses.A_BOLD
+        hborder = [(ord('-'), wall_attr)] * (w + 2)
+        vborder = (ord('|'), wall_attr)
+        self.static_frame.append([vborder] + hborder[1:-1] + [vborder])
+        for y in range(h):
+            glyphs = []
+            cells = [vborder]
+            for x in range(w):
+                i = y * w + x
+                ch = grid[i]
+                if ch == WALL:
+                    up = y > 0 and grid[i - w] == WALL
+                    down = y < h - 1 and grid[i + w] == WALL
+                    left = x > 0 and grid[i - 1] == WALL
+                    right = x < w - 1 and grid[i + 1] == WALL
+                    if up and down and not left and not right:
+                        glyph = '|'
+                    elif left and right and not up and not down:
+                        glyph = '-'
+                    else:
+                        glyph = '+'
+                    attr = wall_attr
+                elif ch == TASK:
+                    glyph = 'T'
+                    attr = task_attr
+                else:
+                    glyph = '.'
+                    attr = 0
+                glyphs.append(glyph)
+                cells.append((ord(glyph), attr))
+            cells.append(vborder)
+            self.static_rows.append("".join(glyphs))
+            self.static_frame.append(cells)
+        self.static_frame.append([vborder] + hborder[1:-1] + [vborder])
+
     def is_in_bounds(self, y: int, x: int) -> bool:
         return 0 <= y < self.height and 0 <= x < self.width
 
     def is_walkable(self, y: int, x: int) -> bool:
-        return self.is_in_bounds(y, x) and self.map[y][x] != '#'
+        return 0 <= y < self.height and 0 <= x < self.width and self.walkable_mask[y * self.width + x] == 1
 
     def is_wall(self, y: int, x: int) -> bool:
-        return self.is_in_bounds(y, x) and self.map[y][x] == '#'
+        return 0 <= y < self.height and 0 <= x < self.width and self.map_flat[y * self.width + x] == WALL
 
     def compute_intersections(self) -> List[Point]:
+        # Whole rows at once as int bitmasks: bit x of rows[y] is set when (y, x) is walkable.
+        # A walkable cell is an intersection when at least 3 of its 4 neighbours are walkable.
+        w = self.width
+        to_bits = bytes.maketrans(b'\x00\x01', b'01')
+        rows = [int(self.walkable_mask[y*w:(y+1)*w].translate(to_bits)[::-1], 2) for y in range(self.height)]
         inter = []
         for y in range(1, self.height-1):
-            for x in range(1, self.width-1):
-                if not self.is_walkable(y, x):
-                    continue
-                deg = sum(1 for dy, dx in [(-1,0),(1,0),(0,-1),(0,1)] if self.is_walkable(y+dy, x+dx))
-                if deg >= 3:
-                    inter.append((y, x))
+            c, up, down = rows[y], rows[y-1], rows[y+1]
+            left, right = c << 1, c >> 1
+            hits = c & ((up & down & (left | right)) | (left & right & (up | down)))
+            while hits:
+                low = hits & -hits
+                inter.append((y, low.bit_length() - 1))
+                hits ^= low
         return inter
 
     # ---------------- Spawning and utility ----------------
@@ -242,7 +451,7 @@ class Game:
         seen = {(cy, cx)}
         while q:
             y, x = q.popleft()
-            if self.is_walkable(y, x) and self.map[y][x] != 'T':
+            if self.is_walkable(y, x) and self.map_flat[y * self.width + x] != TASK:
                 return (y, x)
             for dy, dx in [(-1,0),(1,0),(0,-1),(0,1)]:
                 ny, nx = y+dy, x+dx
@@ -250,22 +459,41 @@ class Game:
                     seen.add((ny, nx)); q.append((ny, nx))
         for y in range(self.height):
             for x in range(self.width):
-                if self.is_walkable(y, x) and self.map[y][x] != 'T':
+                if self.is_walkable(y, x) and self.map_flat[y * self.width + x] != TASK:
                     return (y, x)
         return (1, 1)
 
     def spawn_points(self, n: int) -> List[Point]:
-        free = [(y, x) for (y, x) in self.walkable if self.map[y][x] != 'T']
+        free = [(y, x) for (y, x) in self.walkable if self.map_flat[y * self.width + x] != TASK]
         random.shuffle(free)
         return free[:n]
 
     def entity_at(self, y: int, x: int) -> Optional[Entity]:
-        if self.player.alive and (y, x) == (self.player.y, self.player.x):
-            return self.player
-        for n in self.npcs:
-            if n.alive and (y, x) == (n.y, n.x):
-                return n
-        return None
+        cell = self._pos_index.get((y, x))
+        if not cell:
+            return None
+        if len(cell) == 1:
+            return cell[0]
+        return min(cell, key=lambda e: self._rank[id(e)])
+
+    def _index_add(self, ent: Entity):
+        self._pos_index.setdefault((ent.y, ent.x), []).append(ent)
+
+    def _index_remove(self, ent: Entity):
+        pos = (ent.y, ent.x)
+        cell = self._pos_index[pos]
+        for i, e in enumerate(cell):
+            if e is ent:
+                del cell[i]
+                break
+        if not cell:
+            del self._pos_index[pos]
+
+    def move_entity(self, ent: Entity, y: int, x: int):
+        self._index_remove(ent)
+        ent.y, ent.x = y, x
+        self._index_add(ent)
+        self._dirty = True
 
     # ---------------- Input ----------------
 
@@ -276,6 +504,8 @@ class Game:
             return
         if ch == -1:
             return
+        # Any key (including KEY_RESIZE) may change what is on screen
+        self._dirty = True
 
         if self.meeting_mode:
             self.handle_meeting_input(ch)
@@ -320,8 +550,10 @@ class Game:
             self.in_task = False
             self.task_target = None
         ny, nx = self.player.y + dy, self.player.x + dx
-        if self.is_walkable(ny, nx) and not self.entity_at(ny, nx):
-            self.player.y, self.player.x = ny, nx
+        # The player is always inside the wall border, so its neighbours are in bounds
+        if self.walkable_mask[ny * self.width + nx] and not self.entity_at(ny, nx):
+            self.move_entity(self.player, ny, nx)
+            self._player_moved = True
 
     # ---------------- Update and AI ----------------
 
@@ -335,21 +567,44 @@ class Game:
             if pt is None or pt not in self.tasks or (self.player.y, self.player.x) != pt:
                 self.in_task = False
                 self.task_target = None
+                self._dirty = True
             else:
-                prog = self.tasks[pt] + self.task_progress_rate
+                old = self.tasks[pt]
+                prog = old + self.task_progress_rate
                 if prog >= 1.0:
                     del self.tasks[pt]
+                    self._h_cache.pop(pt, None)
                     self.in_task = False
                     self.task_target = None
+                    self._dirty = True
                 else:
                     self.tasks[pt] = prog
+                    # Only redraw when the progress bar gains a filled cell
+                    if int(self._task_bar_w * prog) != int(self._task_bar_w * old):
+                        self._dirty = True
 
         now = time.time()
 
+        # Adaptive tick: if no bot is due to step and the player stayed put, nothing can move
+        # and no new kill can happen, so only the end-of-tick checks remain.
+        if now - self._earliest_bot_move < self.bot_move_interval and not self._player_moved:
+            self.end_of_tick(now)
+            return
+        self._player_moved = False
+
         # 1) Decide targets and paths for each NPC (no movement yet)
         intents: Dict[NPC, Point] = {}
-        occupied_before: Set[Point] = set((n.y, n.x) for n in self.npcs if n.alive)
-        occupied_before.add((self.player.y, self.player.x))
+        # Occupancy bitmap of every entity's cell before anyone moves; clear last tick's marks first
+        occupied_before = self._occupancy
+        occupied_ids = self._occupied_ids
+        for i in occupied_ids:
+            occupied_before[i] = 0
+        occupied_ids.clear()
+        w = self.width
+        occupied_ids.extend(n.y * w + n.x for n in self.npcs if n.alive)
+        occupied_ids.append(self.player.y * w + self.player.x)
+        for i in occupied_ids:
+            occupied_before[i] = 1
 
         for npc in self.npcs:
             if not npc.alive:
@@ -361,28 +616,34 @@ class Game:
                 npc.kill_cooldown = max(0.0, npc.kill_cooldown - (now - self.last_update))
 
             # Determine target
-            target = self.choose_target(npc)
-            if target != npc.current_target:
+            if npc.role == "impostor":
+                # One BFS picks the nearest victim by walking distance and gives the path to it
+                target, npc.current_path = self.hunt_path(npc, occupied_before)
                 npc.current_target = target
-                npc.current_path = []
-                npc.repath_after = 0.0
+            else:
+                target = self.choose_target(npc)
+                if target != npc.current_target:
+                    npc.current_target = target
+                    npc.current_path = []
+                    npc.repath_after = 0.0
 
             # Decide step
             desired = (npc.y, npc.x)
             if target:
-                # Re-path conditions: no path, path exhausted, path blocked, or timeout
-                need_repath = False
-                if not npc.current_path:
-                    need_repath = True
-                else:
-                    step = npc.current_path[0]
-                    if not self.is_walkable(step[0], step[1]):
-                        need_repath = True
-                    elif step in occupied_before and step != target:
+                if npc.role != "impostor":
+                    # Re-path conditions: no path, path exhausted, path blocked, or timeout
+                    need_repath = False
+                    if not npc.current_path:
                         need_repath = True
-                if need_repath or now >= npc.repath_after:
-                    npc.current_path = self.astar_path((npc.y, npc.x), target, blocked=occupied_before - {target})
-                    npc.repath_after = now + 0.25
+                    else:
+                        step = npc.current_path[0]
+                        if not self.is_walkable(step[0], step[1]):
+                            need_repath = True
+                        elif occupied_before[step[0] * w + step[1]] and step != target:
+                            need_repath = True
+                    if need_repath or now >= npc.repath_after:
+                        npc.current_path = self.astar_path((npc.y, npc.x), target, blocked=occupied_before)
+                        npc.repath_after = now + 0.25
 
                 if npc.current_path:
                     step = npc.current_path[0]
@@ -395,27 +656,38 @@ class Game:
 
             intents[npc] = desired
 
+        self._earliest_bot_move = min((n.last_move_time for n in self.npcs if n.alive), default=now)
+
         # 2) Resolve conflicts: prevent overlaps and head-on swaps
         # Prevent moves onto player
         for npc in list(intents.keys()):
             if intents[npc] == (self.player.y, self.player.x):
                 intents[npc] = (npc.y, npc.x)
 
-        # Build reverse map desired -> npcs
-        dest_map: Dict[Point, List[NPC]] = defaultdict(list)
+        # Build reverse map desired -> npcs, recycling last tick's dict and claimant lists
+        dest_map = self._dest_map
+        pool = self._dest_lists_pool
+        for claimants in dest_map.values():
+            claimants.clear()
+            pool.append(claimants)
+        dest_map.clear()
         for n, pos in intents.items():
-            dest_map[pos].append(n)
+            claimants = dest_map.get(pos)
+            if claimants is None:
+                claimants = dest_map[pos] = pool.pop() if pool else []
+            claimants.append(n)
 
         staying_positions: Set[Point] = { (n.y, n.x) for n, pos in intents.items() if pos == (n.y, n.x) }
 
-        approved: Set[NPC] = set()
+        approved = self._approved
+        approved.clear()
         for pos, claimants in dest_map.items():
             if len(claimants) == 1:
                 n = claimants[0]
                 if pos in staying_positions and pos != (n.y, n.x):
                     continue  # cannot move into a staying occupant
                 # head-on swap detection
-                occupant = self.find_entity_at(pos)
+                occupant = self.entity_at(*pos)
                 if isinstance(occupant, NPC):
                     occ_intent = intents.get(occupant, (occupant.y, occupant.x))
                     if occ_intent == (n.y, n.x):
@@ -433,7 +705,7 @@ class Game:
             desired = intents.get(npc, (npc.y, npc.x))
             if npc in approved and desired != (npc.y, npc.x):
                 npc.last_pos = (npc.y, npc.x)
-                npc.y, npc.x = desired
+                self.move_entity(npc, *desired)
                 if npc.current_path and npc.current_path[0] == desired:
                     npc.current_path.pop(0)
 
@@ -456,6 +728,9 @@ class Game:
                 self.kill_entity(vic)
                 npc.kill_cooldown = self.impostor_kill_cooldown_time
 
+        self.end_of_tick(now)
+
+    def end_of_tick(self, now: float):
         # Win/Lose conditions
         if not self.player.alive:
             self.game_over_screen(win=False, reason="You were eliminated by the impostor.")
@@ -467,8 +742,8 @@ class Game:
             self.running = False
             return
 
-        alive_crew = (1 if self.player.alive else 0) + sum(1 for n in self.npcs if n.alive and n.role == "crewmate")
-        alive_impostors = sum(1 for n in self.npcs if n.alive and n.role == "impostor")
+        alive_crew = self._crew_alive_count
+        alive_impostors = self._impostor_alive_count
         if alive_impostors >= alive_crew and alive_impostors > 0:
             self.game_over_screen(win=False, reason="Impostor outnumbered crew. Impostor wins.")
             self.running = False
@@ -477,23 +752,35 @@ class Game:
         self.last_update = now
 
     def choose_target(self, npc: NPC) -> Optional[Point]:
-        if npc.role == "impostor":
-            # Hunt nearest living non-impostor entity (including player)
-            candidates: List[Entity] = [self.player] + [n for n in self.npcs if n is not npc]
-            candidates = [e for e in candidates if e.alive and not (isinstance(e, NPC) and e.role == "impostor")]
-            if not candidates:
-                return None
-            return min(((e.y, e.x) for e in candidates), key=lambda p: abs(p[0]-npc.y)+abs(p[1]-npc.x))
-        else:
-            if npc.assigned_task and npc.assigned_task not in self.tasks:
-                npc.assigned_task = None
-            if npc.assigned_task is None:
-                if self.tasks:
-                    npc.assigned_task = min(self.tasks.keys(), key=lambda p: abs(p[0]-npc.y)+abs(p[1]-npc.x))
-                else:
-                    if npc.patrol_target is None or (npc.y, npc.x) == npc.patrol_target:
-                        npc.patrol_target = self.choose_patrol_point(npc)
-            return npc.assigned_task or npc.patrol_target
+        # Crewmates only; impostors pick their victim in hunt_path()
+        if npc.assigned_task and npc.assigned_task not in self.tasks:
+            npc.assigned_task = None
+        if npc.assigned_task is None:
+            if self.tasks:
+                npc.assigned_task = min(self.tasks.keys(), key=lambda p: abs(p[0]-npc.y)+abs(p[1]-npc.x))
+            else:
+                if npc.patrol_target is None or (npc.y, npc.x) == npc.patrol_target:
+                    npc.patrol_target = self.choose_patrol_point(npc)
+        return npc.assigned_task or npc.patrol_target
+
+    def hunt_path(self, npc: NPC, occupied: bytearray) -> Tuple[Optional[Point], List[Point]]:
+        # Nearest living non-impostor entity (including player) by walking distance, and the path to it
+        w = self.width
+        victims: List[Entity] = [self.player] + [n for n in self.npcs if n is not npc]
+        targets = {e.y * w + e.x for e in victims if e.alive and not (isinstance(e, NPC) and e.role == "impostor")}
+        if not targets:
+            return None, []
+        found, parent = self._bfs_from((npc.y, npc.x), targets, occupied)
+        if found == -1:
+            return None, []
+        sid = npc.y * w + npc.x
+        cur = found
+        rev: List[Point] = []
+        while cur != sid:
+            rev.append(divmod(cur, w))
+            cur = parent[cur]
+        rev.reverse()
+        return divmod(found, w), rev
 
     def choose_patrol_point(self, npc: NPC) -> Point:
         if self.intersections:
@@ -502,62 +789,54 @@ class Game:
 
     def near_corpse(self, y: int, x: int) -> bool:
         # On or adjacent (Manhattan 0 or 1)
-        for c in self.corpses:
-            if abs(c.y - y) + abs(c.x - x) <= 1:
-                return True
-        return False
+        return bool(self._corpse_zone[y * self.width + x])
+
+    def clear_corpses(self):
+        self.corpses.clear()
+        self._corpse_zone = bytearray(self._N)
 
     # ---------------- Pathfinding ----------------
 
-    def astar_path(self, start: Point, goal: Point, blocked: Set[Point]) -> List[Point]:
+    def astar_path(self, start: Point, goal: Point, blocked: bytearray) -> List[Point]:
+        # blocked: occupancy bitmap by cell id; the goal cell itself is never treated as blocked
         if start == goal:
             return []
         gy, gx = goal
         if not self.is_walkable(gy, gx):
             return []
 
-        def h(p: Point) -> int:
-            return abs(p[0] - gy) + abs(p[1] - gx)
-
-        open_heap = []
-        heapq.heappush(open_heap, (h(start), 0, start))
-        came_from: Dict[Point, Optional[Point]] = {start: None}
-        g_score: Dict[Point, int] = {start: 0}
-        closed: Set[Point] = set()
-
-        while open_heap:
-            _, g, current = heapq.heappop(open_heap)
-            if current in closed:
-                continue
-            closed.add(current)
-            if current == goal:
-                break
-            cy, cx = current
-            for dy, dx in [(-1,0),(1,0),(0,-1),(0,1)]:
-                ny, nx = cy+dy, cx+dx
-                nxt = (ny, nx)
-                if not self.is_walkable(ny, nx):
-                    continue
-                if nxt in blocked and nxt != goal:
-                    continue
-                tentative_g = g + 1
-                if tentative_g < g_score.get(nxt, 1_000_000_000):
-                    g_score[nxt] = tentative_g
-                    came_from[nxt] = current
-                    f = tentative_g + h(nxt)
-                    heapq.heappush(open_heap, (f, tentative_g, nxt))
-
-        if goal not in came_from:
-            return []
-
-        # Reconstruct path (excluding start), result is [step1, step2, ..., goal]
-        cur = goal
-        rev: List[Point] = []
-        while cur is not None and cur != start:
-            rev.append(cur)
-            cur = came_from[cur]
-        rev.reverse()
-        return rev
+        w = self.width
+        walkable = self.walkable_mask
+        sid = start[0] * w + start[1]
+        gid = gy * w + gx
+
+        cache = self._h_cache.get(goal)
+        if cache is None:
+            if len(self._h_cache) >= self._h_cache_goals:
+                self._h_cache.clear()
+            cache = self._h_cache[goal] = {}
+
+        return astar_flat(walkable, blocked, sid, gid, w, cache,
+                          self._g_score, self._came_from, self._closed, self._open_heap, self._touched)
+
+    def _bfs_from(self, src: Point, targets: Set[int], blocked: bytearray) -> Tuple[int, array]:
+        # Breadth-first search over cell ids; stops at the first (i.e. closest) target reached.
+        # Returns that target's id (or -1) and the parent[] array for path reconstruction.
+        w = self.width
+        walkable = self.walkable_mask
+        sid = src[0] * w + src[1]
+        parent = array('i', [-1]) * self._N
+        parent[sid] = sid
+        q = deque([sid])
+        while q:
+            cid = q.popleft()
+            if cid in targets:
+                return cid, parent
+            for nid in (cid - w, cid + w, cid - 1, cid + 1):
+                if walkable[nid] and parent[nid] == -1 and (not blocked[nid] or nid in targets):
+                    parent[nid] = cid
+                    q.append(nid)
+        return -1, parent
 
     # ---------------- Meetings ----------------
 
@@ -579,7 +858,7 @@ class Game:
             self.resolve_meeting_vote()
         elif ch in (ord('q'), ord('Q'), 27):
             self.meeting_mode = False
-            self.corpses.clear()
+            self.clear_corpses()
 
     def resolve_meeting_vote(self):
         voted_out: Optional[NPC] = None
@@ -594,24 +873,9 @@ class Game:
         votes: Dict[Optional[NPC], int] = defaultdict(int)
         votes[voted_out if not player_vote_skip else None] += 1  # player
 
-        for voter in voters:
-            weights = []
-            total = 0.0
-            for c in candidates_plus_skip:
-                if c is None:
-                    w = 0.9
-                else:
-                    w = 1.0 + (0.4 if c.role == "impostor" else 0.0)
-                weights.append(w)
-                total += w
-            r = random.random() * total
-            cum = 0.0
-            choice = None
-            for c, w in zip(candidates_plus_skip, weights):
-                cum += w
-                if r <= cum:
-                    choice = c
-                    break
+        # Vote weights don't depend on the voter, so draw every bot's vote in one call
+        weights = [0.9 if c is None else (1.4 if c.role == "impostor" else 1.0) for c in candidates_plus_skip]
+        for choice in random.choices(candidates_plus_skip, weights=weights, k=len(voters)):
             votes[choice] += 1
 
         top = sorted(votes.items(), key=lambda kv: (-kv[1], random.random()))
@@ -619,7 +883,7 @@ class Game:
         if choice is None:
             self.meeting_message = "No one was ejected (skipped)."
         else:
-            choice.alive = False
+            self.mark_dead(choice)
             if choice.role == "impostor":
                 self.meeting_message = f"{choice.name} was an Impostor. Crewmates win!"
                 self.render()
@@ -629,94 +893,106 @@ class Game:
             else:
                 self.meeting_message = f"{choice.name} was not an Impostor."
 
-        self.corpses.clear()
+        self.clear_corpses()
         self.meeting_mode = False
 
     # ---------------- Rendering ----------------
 
     def render(self):
-        self.stdscr.erase()
         maxy, maxx = self.stdscr.getmaxyx()
         if maxy < self.height + 4 or maxx < self.width + 2:
+            self.stdscr.erase()
+            self.prev_frame = None
             msg = f"Please resize terminal to at least {self.width+2}x{self.height+4}. Current: {maxx}x{maxy}"
             self._safe_addstr(0, 0, msg[:max(1, maxx-1)])
-            self.stdscr.refresh()
+            self.stdscr.noutrefresh()
+            curses.doupdate()
             return
 
-        # Border
-        for x in range(self.width + 2):
-            self._safe_addch(0, x, ord('-'), curses.color_pair(1))
-            self._safe_addch(self.height + 1, x, ord('-'), curses.color_pair(1))
-        for y in range(self.height + 2):
-            self._safe_addch(y, 0, ord('|'), curses.color_pair(1))
-            self._safe_addch(y, self.width + 1, ord('|'), curses.color_pair(1))
+        prev = self.prev_frame
+        if prev is None or len(prev) != maxy or len(prev[0]) != maxx:
+            # First frame or resize: start from a blank screen and a blank shadow
+            self.stdscr.erase()
+            prev = [[BLANK] * maxx for _ in range(maxy)]
+        elif self._meeting_drawn and not self.meeting_mode:
+            # The meeting window covered stdscr; have curses repaint from stdscr's own contents
+            self.stdscr.touchwin()
 
-        # Map with oriented wall glyphs
-        for y in range(self.height):
-            for x in range(self.width):
-                ch = self.map[y][x]
-                if ch == '#':
-                    glyph = self.wall_glyph(y, x)
-                    self._safe_addch(1 + y, 1 + x, ord(glyph), curses.color_pair(1))
-                elif ch == 'T':
-                    self._safe_addch(1 + y, 1 + x, ord('T'), curses.color_pair(4) | curses.A_BOLD)
-                else:
-                    self._safe_addch(1 + y, 1 + x, ord('.'))
+        # Build the new frame in Python: border + map, then dynamic overlays and text lines
+        pad = [BLANK] * (maxx - self.width - 2)
+        frame = [row + pad for row in self.static_frame]
+        frame.extend([BLANK] * maxx for _ in range(maxy - len(frame)))
 
         # Corpses
         for c in self.corpses:
-            self._safe_addch(1 + c.y, 1 + c.x, ord('X'), curses.color_pair(5) | curses.A_BOLD)
+            self._frame_cell(frame, 1 + c.y, 1 + c.x, ord('X'), curses.color_pair(5) | curses.A_BOLD)
 
         # NPCs
         for n in self.npcs:
             if not n.alive:
                 continue
             color = curses.color_pair(3)
-            self._safe_addch(1 + n.y, 1 + n.x, ord(n.char), color | curses.A_BOLD)
+            self._frame_cell(frame, 1 + n.y, 1 + n.x, ord(n.char), color | curses.A_BOLD)
 
         # Player
         if self.player.alive:
-            self._safe_addch(1 + self.player.y, 1 + self.player.x, ord(self.player.char), curses.color_pair(2) | curses.A_BOLD)
+            self._frame_cell(frame, 1 + self.player.y, 1 + self.player.x, ord(self.player.char), curses.color_pair(2) | curses.A_BOLD)
 
         # HUD
         tasks_left = len(self.tasks)
         bodies = len(self.corpses)
-        crew_alive = sum(1 for n in self.npcs if n.alive and n.role == "crewmate") + (1 if self.player.alive else 0)
-        impostors_alive = sum(1 for n in self.npcs if n.alive and n.role == "impostor")
+        crew_alive = self._crew_alive_count
+        impostors_alive = self._impostor_alive_count
         hud = f"Role: Crewmate | Tasks left: {tasks_left} | Bodies: {bodies} | Crew: {crew_alive} | Imp: {impostors_alive}"
-        self._safe_addstr(1 + self.height, 1, hud[:self.width], curses.color_pair(6))
+        self._frame_text(frame, 1 + self.height, 1, hud[:self.width], curses.color_pair(6))
 
         # Report prompt if near a body
         if self.near_corpse(self.player.y, self.player.x):
-            self._safe_addstr(2 + self.height, 1, "Body nearby: press R (or Space) to report", curses.color_pair(5))
+            self._frame_text(frame, 2 + self.height, 1, "Body nearby: press R (or Space) to report", curses.color_pair(5))
 
         if self.in_task and self.task_target:
             prog = self.tasks.get(self.task_target, 0.0)
-            barw = min(30, self.width - 2)
+            barw = self._task_bar_w
             filled = int(barw * prog)
             bar = "[" + "#" * filled + "-" * (barw - filled) + "]"
-            self._safe_addstr(3 + self.height, 1, f"Task progress: {bar}  Press E to stop", curses.color_pair(4))
+            self._frame_text(frame, 3 + self.height, 1, f"Task progress: {bar}  Press E to stop", curses.color_pair(4))
 
         if self.show_help and not self.meeting_mode:
             for i, line in enumerate(HELP_TEXT):
                 if 4 + self.height + i < maxy:
-                    self._safe_addstr(4 + self.height + i, 1, line[:self.width])
-
+                    self._frame_text(frame, 4 + self.height + i, 1, line[:self.width])
+
+        # Diff against the last frame into draw ops: each op is a run of adjacent changed cells
+        # sharing one attribute, so curses gets one addstr per run rather than one addch per cell
+        ops = self._draw_ops
+        ops.clear()
+        for y, row in enumerate(frame):
+            old = prev[y]
+            if row == old:
+                continue
+            x, n = 0, len(row)
+            while x < n:
+                if row[x] == old[x]:
+                    x += 1
+                    continue
+                start, attrs = x, row[x][1]
+                chars = []
+                while x < n and row[x] != old[x] and row[x][1] == attrs:
+                    chars.append(chr(row[x][0]))
+                    x += 1
+                ops.append((y, start, "".join(chars), attrs))
+        self.prev_frame = frame
+
+        # Then emit them in order; nothing reaches the terminal until the doupdate() below
+        for y, x, text, attrs in ops:
+            self._safe_addstr(y, x, text, attrs)
+
+        # Stage stdscr, then the meeting window over it, and flush both in one doupdate()
+        self.stdscr.noutrefresh()
+        self._meeting_drawn = self.meeting_mode
         if self.meeting_mode:
             self.render_meeting()
-
-        self.stdscr.refresh()
-
-    def wall_glyph(self, y: int, x: int) -> str:
-        up = self.is_wall(y-1, x)
-        down = self.is_wall(y+1, x)
-        left = self.is_wall(y, x-1)
-        right = self.is_wall(y, x+1)
-        if up and down and not left and not right:
-            return '|'
-        if left and right and not up and not down:
-            return '-'
-        return '+'
+        curses.doupdate()
 
     def render_meeting(self):
         maxy, maxx = self.stdscr.getmaxyx()
@@ -754,24 +1030,32 @@ class Game:
             except curses.error:
                 pass
 
-        win.refresh()
+        win.noutrefresh()
 
     # ---------------- Misc helpers ----------------
 
-    def kill_entity(self, ent: Entity):
+    def mark_dead(self, ent: Entity):
         ent.alive = False
-        self.corpses.append(Corpse(victim_name=ent.name, y=ent.y, x=ent.x))
-
-    def find_entity_at(self, pos: Point) -> Optional[Entity]:
-        y, x = pos
-        if (self.player.y, self.player.x) == pos and self.player.alive:
-            return self.player
-        for n in self.npcs:
-            if n.alive and (n.y, n.x) == pos:
-                return n
-        return None
+        self._dirty = True
+        self._index_remove(ent)
+        if isinstance(ent, NPC) and ent.role == "impostor":
+            self._impostor_alive_count -= 1
+        else:
+            self._crew_alive_count -= 1
 
-    def wrap_text(self, text: str, width: int) -> List[str]:
+    def kill_entity(self, ent: Entity):
+        self.mark_dead(ent)
+        self.corpses.append(Corpse(victim_name=ent.name, y=ent.y, x=ent.x))
+        # Corpses lie on floor, which never touches the border, so all four neighbours are in bounds
+        cid = ent.y * self.width + ent.x
+        zone = self._corpse_zone
+        for nid in (cid, cid - self.width, cid + self.width, cid - 1, cid + 1):
+            zone[nid] = 1
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def wrap_text(text: str, width: int) -> Tuple[str, ...]:
+        # Pure function of its arguments, so repeated wraps of the same message are cached
         words = text.split()
         lines = []
         cur = []
@@ -787,34 +1071,28 @@ class Game:
                 cur_len += add_len
         if cur:
             lines.append(" ".join(cur))
-        return lines
+        return tuple(lines)
 
     def game_over_screen(self, win: bool, reason: str):
         self.stdscr.erase()
+        self.prev_frame = None  # screen no longer matches the render shadow
         maxy, maxx = self.stdscr.getmaxyx()
         msg = "Crewmates Win!" if win else "Impostor Wins!"
         sub = reason
+        # Lay out the whole screen as (y, x, text, attrs) first, then write it and flush once
         y = maxy // 2 - 1
-        x = max(0, (maxx - len(msg)) // 2)
-        try:
-            self.stdscr.addstr(y, x, msg, curses.A_BOLD | curses.color_pair(6 if win else 5))
-        except curses.error:
-            pass
+        ops = [(y, max(0, (maxx - len(msg)) // 2), msg, curses.A_BOLD | curses.color_pair(6 if win else 5))]
         y += 2
         for line in self.wrap_text(sub, max(10, maxx - 4)):
-            x = max(0, (maxx - len(line)) // 2)
-            try:
-                self.stdscr.addstr(y, x, line)
-            except curses.error:
-                pass
+            ops.append((y, max(0, (maxx - len(line)) // 2), line, 0))
             y += 1
             if y >= maxy - 2:
                 break
-        try:
-            self.stdscr.addstr(maxy - 2, 2, "Press any key to exit...")
-        except curses.error:
-            pass
-        self.stdscr.refresh()
+        ops.append((maxy - 2, 2, "Press any key to exit...", 0))
+        for y, x, text, attrs in ops:
+            self._safe_addstr(y, x, text, attrs)
+        self.stdscr.noutrefresh()
+        curses.doupdate()
         self.stdscr.nodelay(0)
         try:
             self.stdscr.getch()
@@ -822,6 +1100,25 @@ class Game:
             pass
         self.stdscr.nodelay(1)
 
+    def _frame_cell(self, frame: List[List[Cell]], y: int, x: int, ch: int, attrs: int = 0):
+        if 0 <= y < len(frame) and 0 <= x < len(frame[y]):
+            frame[y][x] = (ch, attrs)
+
+    def _frame_text(self, frame: List[List[Cell]], y: int, x: int, s: str, attrs: int = 0):
+        if 0 <= y < len(frame):
+            row = frame[y]
+            s = s[:max(0, len(row) - x)]
+            row[x:x + len(s)] = [(ord(ch), attrs) for ch in s]
+
+    def _input_pending(self) -> bool:
+        # Peek without consuming: read with no wait and push the key back
+        self.stdscr.timeout(0)
+        ch = self.stdscr.getch()
+        if ch == -1:
+            return False
+        curses.ungetch(ch)
+        return True
+
     def _safe_addch(self, y: int, x: int, ch: int, attrs: int = 0):
         try:
             self.stdscr.addch(y, x, ch, attrs)
@@ -835,25 +1132,36 @@ class Game:
             pass
 
     def loop(self):
-        self.stdscr.nodelay(1)
+        # getch() waits for at most the rest of the current tick, so input wakes the loop at
+        # once and an idle game sleeps inside curses instead of in time.sleep()
+        self.stdscr.timeout(int(self.tick_rate * 1000))
         self.stdscr.keypad(1)
         try:
             curses.curs_set(0)
         except curses.error:
             pass
-        self.last_update = time.time()
+        # Tick bookkeeping in integer nanoseconds from the monotonic clock
+        tick_ns = int(self.tick_rate * 1e9)
+        last_tick = time.monotonic_ns()
+        last_render = 0
         while self.running:
-            now = time.time()
-            dt = now - self.last_update
-            if dt < self.tick_rate:
-                time.sleep(self.tick_rate - dt)
-                now = time.time()
-                dt = now - self.last_update
-            self.last_update = now
-
             self.handle_input()
-            self.update(dt)
-            self.render()
+            now = time.monotonic_ns()
+            if now - last_tick >= tick_ns:
+                dt = (now - last_tick) / 1e9
+                last_tick = now
+                self.update(dt)
+            # While keys are queued and a frame went out moments ago (within 10x the usual
+            # render cost), drop this frame and drain input first; the next one shows the result
+            if self._dirty and not (now - last_render < self._render_ema_ns * 10 and self._input_pending()):
+                self._dirty = False
+                start = time.monotonic_ns()
+                self.render()
+                last_render = time.monotonic_ns()
+                cost = last_render - start
+                self._render_ema_ns = cost if not self._render_ema_ns else (9 * self._render_ema_ns + cost) // 10
+            left_ns = tick_ns - (time.monotonic_ns() - last_tick)
+            self.stdscr.timeout(max(1, left_ns // 1_000_000))
 
 def main(stdscr):
     game = Game(stdscr)
@@ -1,6 +1,8 @@
 import curses
 import random
 import time
+from array import array
+from collections import deque
 
 # Tetris shapes (rotations)
 SHAPES = [
@@ -15,20 +17,78 @@ SHAPES = [
 
 BOARD_WIDTH = 10
 BOARD_HEIGHT = 20
+FPS = 20
+FRAME_NS = 1_000_000_000 // FPS
+FALL_NS = 500_000_000  # gravity step
+FULL_ROW = (1 << BOARD_WIDTH) - 1
 
 def rotate(shape):
     return [list(row) for row in zip(*shape[::-1])]
 
-def rotate_ccw(shape):
-    return [list(row) for row in zip(*shape)][::-1]
+def row_masks(shape):
+    # One int per shape row; bit x is set when column x is filled
+    return tuple(sum(1 << x for x, cell in enumerate(row) if cell) for row in shape)
+
+def all_rotations(shape):
+    # Distinct clockwise turns only: O has one, I/S/Z have two, the rest four
+    rots = [shape]
+    turned = rotate(shape)
+    while turned != shape:
+        rots.append(turned)
+        turned = rotate(turned)
+    return rots
+
+def rotation_entry(shape):
+    masks = row_masks(shape)
+    width = len(shape[0])
+    # Collision probes per legal column x, already shifted into board columns and ordered
+    # bottom row first (falling pieces almost always hit with their lowest row)
+    probes = tuple(tuple((dy, masks[dy] << x) for dy in reversed(range(len(masks))))
+                   for x in range(BOARD_WIDTH - width + 1))
+    return width, masks, probes
+
+# SHAPE_ROTATIONS[shape_id][rot] -> (width, row masks top to bottom, probes by column); rot + 1
+# (mod the number of distinct turns) is a clockwise turn.
+# Every shape fills its whole bounding box edge to edge, which valid_position relies on.
+SHAPE_ROTATIONS = tuple(tuple(rotation_entry(r) for r in all_rotations(s)) for s in SHAPES)
+
+# 7-bag randomizer: each run of seven spawns is one shuffled copy of every shape
+bag = deque()
+
+def next_shape_id():
+    if not bag:
+        ids = list(range(len(SHAPES)))
+        random.shuffle(ids)
+        bag.extend(ids)
+    return bag.popleft()
 
 def create_board():
-    return [[0] * BOARD_WIDTH for _ in range(BOARD_HEIGHT)]
+    # One bitmask per row, same bit layout as the piece masks
+    return array('H', [0] * BOARD_HEIGHT)
 
-def draw_board(stdscr, board, piece, pos):
-    stdscr.clear()
+# Screen text for every possible row mask, e.g. 0b101 -> "[]  []" followed by blanks
+ROW_STRINGS = tuple("".join("[]" if mask >> x & 1 else "  " for x in range(BOARD_WIDTH))
+                    for mask in range(1 << BOARD_WIDTH))
+
+# (board row, piece row) masks currently on screen, so draw_board only rewrites rows that changed.
+# None never equals a pair, so the first frame draws every row.
+prev_rows = [None] * BOARD_HEIGHT
+
+# Terminal size, read at startup and on KEY_RESIZE rather than every frame
+screen_size = [0, 0]
+ncols = BOARD_WIDTH  # board columns that fit on screen (x * 2 + 1 < max_x)
+board_fits = True  # every board row and column fits, so draw_board can skip its bounds checks
+
+def read_screen_size(stdscr):
+    global ncols, board_fits
     max_y, max_x = stdscr.getmaxyx()
-    # Draw border
+    screen_size[:] = [max_y, max_x]
+    ncols = min(BOARD_WIDTH, max_x // 2)
+    board_fits = max_y > BOARD_HEIGHT and ncols == BOARD_WIDTH
+
+def draw_border(stdscr):
+    # The border never changes, so it is drawn once at startup (and again after a resize)
+    max_y, max_x = screen_size
     top = 0
     left = 0
     right = BOARD_WIDTH * 2
@@ -43,88 +103,128 @@ def draw_board(stdscr, board, piece, pos):
             stdscr.addstr(top, x, "-")
         if bottom < max_y:
             stdscr.addstr(bottom, x, "-")
-    # Draw board
+
+def draw_board(stdscr, board, piece, pos):
+    max_y = screen_size[0]
+    # Piece masks shifted into board columns, keyed by board row
+    width, masks, _ = piece
+    piece_rows = {}
+    for py, mask in enumerate(masks):
+        by = pos[0] + py
+        if 0 <= by < BOARD_HEIGHT:
+            piece_rows[by] = (mask << pos[1] if pos[1] >= 0 else mask >> -pos[1]) & FULL_ROW
     for y, row in enumerate(board):
-        for x, cell in enumerate(row):
-            if y + 1 < max_y and x * 2 + 1 < max_x:
-                if cell:
-                    stdscr.addstr(y + 1, x * 2 + 1, "[]")
-                else:
-                    stdscr.addstr(y + 1, x * 2 + 1, "  ")
-    # Draw current piece
-    for py, row in enumerate(piece):
-        for px, cell in enumerate(row):
-            by, bx = pos[0] + py, pos[1] + px
-            if cell and 0 <= by < BOARD_HEIGHT and 0 <= bx < BOARD_WIDTH:
-                if by + 1 < max_y and bx * 2 + 1 < max_x:
-                    stdscr.addstr(by + 1, bx * 2 + 1, "[]", curses.A_REVERSE)
-    stdscr.refresh()
+        shown = (row, piece_rows.get(y, 0))
+        if shown == prev_rows[y]:
+            continue
+        prev_rows[y] = shown
+        # One write for the whole row, then the piece's cells again in reverse video
+        prow = shown[1]
+        if not row | prow and y + 1 < max_y:
+            # Empty row: clear to end of line (nothing is drawn right of the board), which
+            # curses can send as one erase sequence instead of a run of spaces
+            stdscr.move(y + 1, 1)
+            stdscr.clrtoeol()
+        elif board_fits:
+            stdscr.addstr(y + 1, 1, ROW_STRINGS[row | prow])
+        elif y + 1 < max_y:
+            stdscr.addstr(y + 1, 1, ROW_STRINGS[row | prow][:ncols * 2])
+        else:
+            continue
+        x = 0
+        while prow >> x:
+            if prow >> x & 1:
+                start = x
+                while prow >> x & 1:
+                    x += 1
+                if start < ncols:
+                    stdscr.addstr(y + 1, start * 2 + 1, "[]" * (min(x, ncols) - start), curses.A_REVERSE)
+            else:
+                x += 1
+    stdscr.noutrefresh()
 
 def valid_position(board, piece, pos):
-    for py, row in enumerate(piece):
-        for px, cell in enumerate(row):
-            if cell:
-                by, bx = pos[0] + py, pos[1] + px
-                if bx < 0 or bx >= BOARD_WIDTH or by < 0 or by >= BOARD_HEIGHT:
-                    return False
-                if board[by][bx]:
-                    return False
+    width, masks, probes = piece
+    y, x = pos
+    if x < 0 or x + width > BOARD_WIDTH or y < 0 or y + len(masks) > BOARD_HEIGHT:
+        return False
+    for dy, mask in probes[x]:
+        if board[y + dy] & mask:
+            return False
     return True
 
 def main(stdscr):
     curses.curs_set(0)
-    stdscr.nodelay(True)
+    stdscr.timeout(1000 // FPS)
     board = create_board()
-    piece = random.choice(SHAPES)
-    pos = [0, BOARD_WIDTH // 2 - len(piece[0]) // 2]
-    fall_time = 0.5
-    last_fall = time.time()
+    shape_id, rot = next_shape_id(), 0
+    piece = SHAPE_ROTATIONS[shape_id][rot]
+    pos = (0, BOARD_WIDTH // 2 - piece[0] // 2)
+    last_fall = time.monotonic_ns()
+    read_screen_size(stdscr)
+    draw_border(stdscr)
+    dirty = True
 
     while True:
-        draw_board(stdscr, board, piece, pos)
+        frame_start = time.monotonic_ns()
+        # Blocks for at most the rest of the frame, but returns as soon as a key arrives
         key = stdscr.getch()
-        new_pos = pos[:]
-        new_piece = [row[:] for row in piece]
+        ny, nx = pos
         if key == ord('q'):
             break
         elif key == curses.KEY_LEFT:
-            new_pos[1] -= 1
+            nx -= 1
         elif key == curses.KEY_RIGHT:
-            new_pos[1] += 1
+            nx += 1
         elif key == curses.KEY_DOWN:
-            new_pos[0] += 1
-        elif key == ord(' '):  # rotate clockwise
-            rotated = rotate(piece)
-            if valid_position(board, rotated, pos):
-                piece = rotated
-        elif key == ord('r'):  # rotate counter-clockwise
-            rotated = rotate_ccw(piece)
-            if valid_position(board, rotated, pos):
-                piece = rotated
+            ny += 1
+        elif key == curses.KEY_RESIZE:
+            # Start over on a blank screen: border now, every cell on the next draw
+            read_screen_size(stdscr)
+            stdscr.erase()
+            draw_border(stdscr)
+            prev_rows[:] = [None] * BOARD_HEIGHT
+            dirty = True
+        elif key in (ord(' '), ord('r')):  # rotate clockwise / counter-clockwise
+            rotations = SHAPE_ROTATIONS[shape_id]
+            new_rot = (rot + (1 if key == ord(' ') else -1)) % len(rotations)
+            rotated = rotations[new_rot]
+            if new_rot != rot and valid_position(board, rotated, pos):
+                piece, rot = rotated, new_rot
+                dirty = True
         # Move piece if valid
-        if valid_position(board, piece, new_pos):
-            pos = new_pos
+        if (ny, nx) != pos and valid_position(board, piece, (ny, nx)):
+            pos = (ny, nx)
+            dirty = True
         # Piece falls
-        if time.time() - last_fall > fall_time:
-            if valid_position(board, piece, [pos[0] + 1, pos[1]]):
-                pos[0] += 1
+        if time.monotonic_ns() - last_fall > FALL_NS:
+            if valid_position(board, piece, (pos[0] + 1, pos[1])):
+                pos = (pos[0] + 1, pos[1])
             else:
-                # Lock piece
-                for py, row in enumerate(piece):
-                    for px, cell in enumerate(row):
-                        if cell:
-                            by, bx = pos[0] + py, pos[1] + px
-                            if 0 <= by < BOARD_HEIGHT and 0 <= bx < BOARD_WIDTH:
-                                board[by][bx] = 1
-                # Clear full lines
-                board[:] = [row for row in board if not all(cell == 1 for cell in row)]
-                while len(board) < BOARD_HEIGHT:
-                    board.insert(0, [0] * BOARD_WIDTH)
+                # Lock piece; only the rows it landed on can have become full
+                top = pos[0]
+                for py, mask in enumerate(piece[1]):
+                    board[top + py] |= mask << pos[1]
+                full = [y for y in range(top, top + len(piece[1])) if board[y] == FULL_ROW]
+                if full:
+                    # Clear full lines (bottom-up so earlier indexes stay valid), then refill the top
+                    for y in reversed(full):
+                        del board[y]
+                    board[:0] = array('H', [0] * len(full))
                 # New piece
-                piece = random.choice(SHAPES)
-                pos = [0, BOARD_WIDTH // 2 - len(piece[0]) // 2]
-            last_fall = time.time()
-        time.sleep(0.05)
+                shape_id, rot = next_shape_id(), 0
+                piece = SHAPE_ROTATIONS[shape_id][rot]
+                pos = (0, BOARD_WIDTH // 2 - piece[0] // 2)
+            last_fall = time.monotonic_ns()
+            dirty = True
+        # Only redraw when the piece or board changed this tick
+        if dirty:
+            draw_board(stdscr, board, piece, pos)
+            curses.doupdate()
+            dirty = False
+        # Wait out the rest of the frame in the next getch, so slow frames don't add up
+        elapsed = time.monotonic_ns() - frame_start
+        stdscr.timeout(max(1, (FRAME_NS - elapsed) // 1_000_000))
 
 if __name__ == "__main__":
     curses.wrapper(main)